@@ -9,80 +9,104 @@ Key Features:
      → Leetspeak, capitalization, prefix/suffix combos, year appends
      → Optional reversed and repeated patterns
  - Optional gzip compression for large wordlists
- - Bounded and performance-optimized generation (~20k words max)
+ - Bounded, streaming generation (stops at ~20k unique words)
  - Clean CLI help and modern interactive UX
 """
 
 import argparse
+import functools
 import itertools
-import sys
-import gzip
+import os
+import re
+import shlex
 from datetime import datetime
 
 # ------------------ Imports & Optional Dependencies ------------------
+# zxcvbn is imported on first use (see analyze_password) so that --help and
+# --generate-only don't pay for loading its dictionaries.
 try:
-    from zxcvbn import zxcvbn
-except Exception:
-    print("ERROR: zxcvbn not installed. Run: pip install zxcvbn")
-    sys.exit(1)
-
-try:
-    import nltk
-    from nltk.tokenize import word_tokenize
-    NLTK_AVAILABLE = True
-except Exception:
-    NLTK_AVAILABLE = False
+    from isal import isal_zlib as _zlib  # drop-in zlib API, several times faster
+except ImportError:
+    import zlib as _zlib
 
 # ------------------ Configuration ------------------
-COMMON_SUFFIXES = ["", "1", "12", "123", "1234", "12345", "!", "@", "#", "$", "2022", "2023", "2024", "2025"]
-COMMON_PREFIXES = ["", "!", "@", "#"]
+COMMON_SUFFIXES = ("", "1", "12", "123", "1234", "12345", "!", "@", "#", "$", "2022", "2023", "2024", "2025")
+COMMON_PREFIXES = ("", "!", "@", "#")
 LEET_MAP = {
-    "a": ["4", "@"], "A": ["4", "@"],
-    "e": ["3"], "E": ["3"],
-    "i": ["1", "!"], "I": ["1", "!"],
-    "o": ["0"], "O": ["0"],
-    "s": ["5", "$"], "S": ["5", "$"],
-    "t": ["7"], "T": ["7"],
-    "l": ["1"], "L": ["1"]
+    "a": ("4", "@"), "A": ("4", "@"),
+    "e": ("3",), "E": ("3",),
+    "i": ("1", "!"), "I": ("1", "!"),
+    "o": ("0",), "O": ("0",),
+    "s": ("5", "$"), "S": ("5", "$"),
+    "t": ("7",), "T": ("7",),
+    "l": ("1",), "L": ("1",)
 }
 MAX_LEET_VARIANTS_PER_WORD = 40
+MAX_LEET_POSITIONS = 8       # leetable positions considered per word (bounds the pair loop)
 MAX_COMBINED_WORDS = 20000
 MAX_COMBO_PARTS = 3
+MAX_PARTS = 16               # distinct parts fed to the permutation expansion
+MAX_PART_LEN = 32            # longer inputs are truncated
+MAX_ANALYZE_LEN = 100        # zxcvbn only looks at this many chars (its recommended cap)
+MAX_USER_INPUTS = 50
+WRITE_BATCH_LINES = 1000
+WRITE_BUFFER_SIZE = 1 << 20
+
+# first-choice substitution for every leetable char, applied in C via str.translate
+_LEET_FIRST = {k: v[0] for k, v in LEET_MAP.items()}
+_LEET_ALL_TRANS = str.maketrans(_LEET_FIRST)
+_LEET_CHARS_RE = re.compile("[" + "".join(LEET_MAP) + "]")
+_TOKEN_RE = re.compile(r"[^\W_]{2,}")  # runs of 2+ letters/digits
+
+_zxcvbn = None
 # ---------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
 def permutations_case(word):
     """Generate case variations for a given word."""
     s = {word, word.lower(), word.upper(), word.capitalize()}
     if len(word) > 1:
         s.add(word[0].upper() + word[1:].lower())
-    return sorted(s)
+    return tuple(sorted(s))
 
 
+def _iter_leet(word):
+    """Yield leetspeak variants of a word, most aggressive first (may repeat)."""
+    yield word
+    # replace all mapped chars
+    yield word.translate(_LEET_ALL_TRANS)
+
+    # replace 1 or 2 positions (substitutions are single chars, so slicing keeps indices valid);
+    # only the first MAX_LEET_POSITIONS leetable chars are used, so crafted inputs like
+    # "aeiosl" * 20 stay cheap
+    subs_at = [(m.start(), _LEET_FIRST[m.group()])
+               for m in itertools.islice(_LEET_CHARS_RE.finditer(word), MAX_LEET_POSITIONS)]
+    for n, (i, a) in enumerate(subs_at):
+        head = word[:i] + a
+        yield head + word[i + 1:]
+        for j, b in subs_at[n + 1:]:
+            yield head + word[i + 1:j] + b + word[j + 1:]
+
+
+def _take_unique(iterable, limit):
+    """Yield unique items in order, stopping as soon as ``limit`` have been yielded."""
+    if limit <= 0:
+        return
+    seen = set()
+    for item in iterable:
+        if item in seen:
+            continue
+        seen.add(item)
+        yield item
+        if len(seen) >= limit:
+            return
+
+
+@functools.lru_cache(maxsize=4096)
 def leet_variants(word, max_variants=MAX_LEET_VARIANTS_PER_WORD):
     """Generate limited leetspeak variants for a word."""
-    chars = list(word)
-    indices = [i for i, ch in enumerate(chars) if ch in LEET_MAP]
-    variants = {word}
-
-    # replace 1 or 2 positions
-    for r in range(1, min(3, len(indices) + 1)):
-        for combo in itertools.combinations(indices, r):
-            w = chars.copy()
-            for idx in combo:
-                subs = LEET_MAP.get(chars[idx], [])
-                if subs:
-                    w[idx] = subs[0]
-            variants.add("".join(w))
-
-    # replace all mapped chars
-    w_all = chars.copy()
-    for i, ch in enumerate(chars):
-        if ch in LEET_MAP:
-            w_all[i] = LEET_MAP[ch][0]
-    variants.add("".join(w_all))
-
-    return list(variants)[:max_variants]
+    return tuple(_take_unique(_iter_leet(word), max_variants))
 
 
 def expand_years(years_arg):
@@ -99,67 +123,157 @@ def expand_years(years_arg):
         return []
 
 
+def iter_candidates(parts, years=None, add_reversed=False, add_repeats=False):
+    """Lazily yield raw wordlist candidates (may contain duplicates)."""
+    years = years or []
+
+    # drop blanks and case-insensitive duplicates ("john" vs "John"), keeping the first spelling;
+    # parts are truncated and capped since permutations grow as n!/(n-r)!
+    uniq = {}
+    for p in parts:
+        if p.strip():
+            p = p[:MAX_PART_LEN]
+            uniq.setdefault(p.casefold(), p)
+    parts = list(uniq.values())[:MAX_PARTS]
+
+    # variants are memoized across combos; start each run with empty caches
+    permutations_case.cache_clear()
+    leet_variants.cache_clear()
+
+    # year appends are just extra suffixes (deduplicated, so --years 2020 2025 doesn't redo
+    # the built-in "2024"); build the affix tables once per run and bind them (and the
+    # cached helpers) to locals for the hot loop below
+    suffixes = tuple(dict.fromkeys((*COMMON_SUFFIXES, *map(str, years))))
+    prefixes = COMMON_PREFIXES
+    case_variants, leet = permutations_case, leet_variants
+
+    # single-part and multi-part combos, each distinct base string expanded once
+    bases = dict.fromkeys(
+        "".join(combo)
+        for r in range(1, min(MAX_COMBO_PARTS, len(parts)) + 1)
+        for combo in itertools.permutations(parts, r)
+    )
+    for base in bases:
+        for variant in case_variants(base):
+            yield variant
+            yield from leet(variant)
+            yield from [variant + suf for suf in suffixes]
+            yield from [pre + variant for pre in prefixes]
+        if add_reversed:
+            yield base[::-1]
+        if add_repeats:
+            yield base * 2
+
+    # alphanumeric sub-tokens (e.g. "mary-jane" -> "mary", "jane")
+    for t in _TOKEN_RE.findall(" ".join(parts)):
+        yield from permutations_case(t)
+
+
+def iter_wordlist(parts, years=None, max_words=MAX_COMBINED_WORDS,
+                  add_reversed=False, add_repeats=False):
+    """Lazily yield the wordlist for the given parts.
+
+    Candidates are deduplicated in generation order and generation stops as
+    soon as ``max_words`` unique words have been yielded.
+    """
+    return _take_unique(iter_candidates(parts, years, add_reversed, add_repeats), max_words)
+
+
 def generate_from_parts(parts, years=None, max_words=MAX_COMBINED_WORDS,
                         add_reversed=False, add_repeats=False):
-    """Generate password wordlist combinations from given parts."""
-    years = years or []
-    words = set()
-    parts = [p for p in parts if p.strip()]
-
-    # single-part and multi-part combos
-    for r in range(1, min(MAX_COMBO_PARTS, len(parts)) + 1):
-        for combo in itertools.permutations(parts, r):
-            base = "".join(combo)
-            for variant in permutations_case(base):
-                words.add(variant)
-                for leet in leet_variants(variant):
-                    words.add(leet)
-                for suf in COMMON_SUFFIXES:
-                    words.add(variant + suf)
-                for pre in COMMON_PREFIXES:
-                    words.add(pre + variant)
-                for y in years:
-                    words.add(variant + str(y))
-            if add_reversed:
-                words.add(base[::-1])
-            if add_repeats:
-                words.add(base * 2)
-
-    # optional tokenization
-    if NLTK_AVAILABLE:
-        try:
-            tokens = word_tokenize(" ".join(parts))
-            for t in tokens:
-                if t.isalnum() and len(t) > 1:
-                    words.update(permutations_case(t))
-        except Exception:
-            pass
-
-    # cap total
-    return sorted(words)[:max_words]
+    """Generate password wordlist combinations from given parts (see iter_wordlist)."""
+    return list(iter_wordlist(parts, years, max_words, add_reversed, add_repeats))
+
+
+@functools.lru_cache(maxsize=1024)
+def _zxcvbn_cached(password, user_inputs):
+    """Run zxcvbn (imported lazily on first call), memoized on its immutable inputs."""
+    global _zxcvbn
+    if _zxcvbn is None:
+        from zxcvbn import zxcvbn as _zxcvbn
+    return _zxcvbn(password, user_inputs=list(user_inputs))
 
 
 def analyze_password(password, user_inputs=None):
-    """Analyze password using zxcvbn."""
+    """Analyze password using zxcvbn.
+
+    Results are cached, so the returned dict is shared and must not be
+    mutated. The cache keeps analyzed passwords in memory; call
+    clear_cache() in security-sensitive contexts.
+    """
+    # bound the input; zxcvbn matching cost grows quickly with length
+    password = password[:MAX_ANALYZE_LEN]
+    user_inputs = tuple(u[:MAX_ANALYZE_LEN] for u in (user_inputs or [])[:MAX_USER_INPUTS])
     try:
-        return zxcvbn(password, user_inputs=user_inputs or [])
+        return _zxcvbn_cached(password, user_inputs)
+    except ImportError:
+        return {"score": 0, "crack_times_display": {},
+                "feedback": {"warning": "zxcvbn not installed. Run: pip install zxcvbn", "suggestions": []}}
     except Exception:
         return {"score": 0, "crack_times_display": {}, "feedback": {"warning": "zxcvbn error", "suggestions": []}}
 
 
+def clear_cache():
+    """Forget cached password analyses (and the passwords they hold)."""
+    _zxcvbn_cached.cache_clear()
+
+
+def _write_all(fd, data):
+    """os.write() to a raw fd until all of ``data`` is written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 def save_wordlist(words, outpath="wordlist.txt", gzip_out=False):
-    """Save wordlist to .txt or .gz file."""
+    """Save wordlist to .txt or .gz file.
+
+    ``words`` may be any iterable (e.g. a generator); it is consumed in
+    batches without being materialized. Each batch is encoded to UTF-8 once
+    and written in binary mode; plain output goes straight to a raw fd.
+    """
     if gzip_out:
         if not outpath.endswith(".gz"):
             outpath += ".gz"
-        with gzip.open(outpath, "wt", encoding="utf-8") as f:
-            f.writelines(w + "\n" for w in words)
+        # compress batches straight into the file; wbits=31 emits the gzip header/trailer
+        comp = _zlib.compressobj(1, wbits=31)
+        f = open(outpath, "wb", buffering=WRITE_BUFFER_SIZE)
+
+        def write(data):
+            f.write(comp.compress(data))
+
+        def close():
+            with f:
+                f.write(comp.flush())
     else:
-        with open(outpath, "w", encoding="utf-8") as f:
-            f.writelines(w + "\n" for w in words)
+        fd = os.open(outpath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        write, close = functools.partial(_write_all, fd), functools.partial(os.close, fd)
+    try:
+        it = iter(words)
+        while True:
+            batch = list(itertools.islice(it, WRITE_BATCH_LINES))
+            if not batch:
+                break
+            write(("\n".join(batch) + "\n").encode("utf-8"))
+    finally:
+        close()
     return outpath
 
 
+def _split_words(text):
+    """Split comma/space separated input; double quotes keep multi-word values together."""
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace += ","
+    lexer.whitespace_split = True
+    lexer.commenters = ""  # '#' is a common password char, not a comment
+    lexer.quotes = '"'  # apostrophes belong to names like O'Brien
+    lexer.escape = ""  # keep backslashes as typed
+    try:
+        return list(lexer)
+    except ValueError:  # unbalanced double quote
+        return text.replace(",", " ").split()
+
+
 def interactive_collect(existing_parts=None):
     """Interactively collect inputs for wordlist generation."""
     existing_parts = existing_parts or []
@@ -168,12 +282,13 @@ def interactive_collect(existing_parts=None):
     if existing_parts:
         print("Existing inputs detected from CLI:", existing_parts)
         if input("Add more data interactively? [Y/n]: ").strip().lower() == "n":
-            extra = input("Add additional comma-separated words: ").strip()
+            extra = input("Add additional words (commas or spaces): ").strip()
             if extra:
-                existing_parts.extend([x.strip() for x in extra.split(",") if x.strip()])
+                existing_parts.extend(_split_words(extra))
             return existing_parts, []
 
     # fresh inputs
+    print('(separate values with commas or spaces; quote multi-word values, e.g. "New York")')
     names = input("👤 Name(s): ").strip()
     pets = input("🐶 Pet name(s): ").strip()
     favorites = input("⭐ Favorite things: ").strip()
@@ -184,16 +299,16 @@ def interactive_collect(existing_parts=None):
     parts = existing_parts.copy()
     for field in (names, pets, favorites, dobs, extra):
         if field:
-            parts.extend([x.strip() for x in field.replace(",", " ").split() if x.strip()])
+            parts.extend(x for x in _split_words(field) if x.strip())
 
-    years = expand_years(years_raw.replace(",", " ").split()) if years_raw else []
+    years = expand_years(_split_words(years_raw)) if years_raw else []
     return parts, years
 
 
 def parse_args():
     """CLI argument parser."""
     p = argparse.ArgumentParser(description="Password Strength Analyzer & Custom Wordlist Generator")
-    p.add_argument("--password", "-p", help="Password to analyze")
+    p.add_argument("--password", "-p", help=f"Password to analyze (only the first {MAX_ANALYZE_LEN} chars are scored)")
     p.add_argument("--name", nargs="*", help="Name(s)")
     p.add_argument("--pet", nargs="*", help="Pet name(s)")
     p.add_argument("--favorite", nargs="*", help="Favorite things")
@@ -243,10 +358,18 @@ def main():
     # generate wordlist
     if parts:
         print("\n🧠 Generating custom wordlist...")
-        words = generate_from_parts(parts, years=years, max_words=args.maxwords,
-                                    add_reversed=args.add_reversed, add_repeats=args.add_repeats)
-        path = save_wordlist(words, args.out, args.gzip)
-        print(f"✅ Saved {len(words)} words to: {path}")
+        count = 0
+
+        def words():
+            # stream straight into the file; only the count is kept
+            nonlocal count
+            for w in iter_wordlist(parts, years=years, max_words=args.maxwords,
+                                   add_reversed=args.add_reversed, add_repeats=args.add_repeats):
+                count += 1
+                yield w
+
+        path = save_wordlist(words(), args.out, args.gzip)
+        print(f"✅ Saved {count} words to: {path}")
         print("\n🎉 Operation complete! You can open the file or use it in password cracking tools.")
     else:
         print("No parts provided. Please rerun with CLI args or interactively.")
@@ -12,78 +12,188 @@ Date: 2025-10-27
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import io
 import os
 import json
+import queue
 from datetime import datetime
+from itertools import chain
+import math
 import re
+from bisect import bisect_right
 
 # Try importing backend logic
 try:
     from password_analyzer import (
         generate_from_parts,
+        iter_wordlist,
         analyze_password,
+        clear_cache,
         save_wordlist,
         expand_years,
         permutations_case,
     )
 except ImportError:
     # --- Fallback stubs (if password_analyzer.py not present) ---
+    def iter_wordlist(parts, years=None, max_words=20000, add_reversed=False, add_repeats=False):
+        # ordered dedup across all parts, stopping as soon as max_words are out
+        seen = set()
+        for w in chain.from_iterable((p, p.lower(), p.capitalize()) for p in parts):
+            if len(seen) >= max_words:
+                return
+            if w not in seen:
+                seen.add(w)
+                yield w
+
     def generate_from_parts(parts, years=None, max_words=20000, add_reversed=False, add_repeats=False):
-        words = []
-        for p in parts:
-            words.extend({p, p.lower(), p.capitalize()})
-        return list(words)[:max_words]
+        return list(iter_wordlist(parts, years, max_words, add_reversed, add_repeats))
 
     def analyze_password(pwd, user_inputs=None):
         return {"score": 0, "crack_times_display": {}, "feedback": {"suggestions": []}}
 
+    def clear_cache(): pass
+
     def save_wordlist(words, outpath="wordlist.txt", gzip_out=False):
-        with open(outpath, "w", encoding="utf-8") as f:
-            f.writelines(w + "\n" for w in words)
+        if gzip_out and not outpath.endswith(".gz"):
+            outpath += ".gz"
+        raw = gzip.open(outpath, "wb", compresslevel=1) if gzip_out else open(outpath, "wb", buffering=0)
+        with io.BufferedWriter(raw, buffer_size=1 << 20) as f:
+            # hand the sink ~256 KiB blocks instead of one small write per word
+            buf = bytearray()
+            for w in words:
+                buf += w.encode("utf-8")
+                buf += b"\n"
+                if len(buf) >= 1 << 18:
+                    f.write(buf)
+                    buf.clear()
+            f.write(buf)
         return outpath
 
     def expand_years(y): return []
     def permutations_case(w): return [w, w.lower(), w.capitalize()]
 
 
-# ---------------- TOOLTIP CLASS ----------------
-class ToolTip:
-    """Custom tooltip popup for widgets"""
+SETTINGS_FILE = "gui_settings.json"
+ANALYZE_DEBOUNCE_MS = 250  # zxcvbn runs at most ~4x/sec while typing
+UI_POLL_MS = 50  # how often the Tk thread picks up worker results
+_SEP = "=" * 60
+_ANALYSIS_TPL = (_SEP + "\nPASSWORD ANALYSIS RESULTS\n" + _SEP +
+                 "\nPassword: {mask}\nScore: {score}/4\n\nCRACK TIME ESTIMATES:{ct}{warn}{sugg}\n" + _SEP)
+
+# static ttk styling, applied once in PasswordAnalyzerGUI.setup_styles
+_STYLE_SPEC = (
+    ("TFrame", {"background": "#1a1a1a"}),
+    ("TLabel", {"background": "#1a1a1a", "foreground": "#ffffff"}),
+    ("TButton", {"background": "#2d2d2d", "foreground": "#ffffff"}),
+    ("TNotebook", {"background": "#1a1a1a"}),
+    ("TNotebook.Tab", {"background": "#2d2d2d", "foreground": "#ffffff", "padding": [20, 10]}),
+)
+_STYLE_MAPS = (
+    # Tk switches to "active" on hover itself, so buttons need no <Enter>/<Leave> callbacks
+    ("TButton", {"background": [("active", "#404040"), ("!active", "#2d2d2d")]}),
+    ("TNotebook.Tab", {"background": [("selected", "#404040")]}),
+)
+
+_SPLIT_RE = re.compile(r"[,\s]+")
+
 
-    def __init__(self, widget, text=""):
-        self.widget = widget
-        self.text = text
-        self.tooltip_window = None
-        widget.bind("<Enter>", self.show_tooltip)
-        widget.bind("<Leave>", self.hide_tooltip)
+def _tokenize(s):
+    """Split a comma/whitespace separated field into tokens"""
+    # str.split() is a single C-level scan; the regex is only needed when commas are present
+    if "," not in s:
+        return s.split()
+    return [t for t in _SPLIT_RE.split(s) if t]
 
-    def show_tooltip(self, event=None):
-        if self.tooltip_window or not self.text:
+
+_LOG2 = math.log2
+_ENTROPY_THRESHOLDS = (28, 36, 60, 128)  # bits separating scores 0..4
+
+
+def _quick_entropy_score(pwd):
+    """Cheap 0-4 strength estimate from NIST-style entropy: len * log2(charset size)"""
+    pool = (26 * any(c.islower() for c in pwd) + 26 * any(c.isupper() for c in pwd)
+            + 10 * any(c.isdigit() for c in pwd) + 32 * any(not c.isalnum() for c in pwd))
+    bits = len(pwd) * _LOG2(pool) if pool else 0
+    return bisect_right(_ENTROPY_THRESHOLDS, bits)
+
+
+# ---------------- TOOLTIP CLASS ----------------
+class ToolTip:
+    """Custom tooltip popup for widgets (all tooltips share one lazily built popup)"""
+
+    # every tooltip widget carries this bindtag, so Enter/Leave are bound once for the class
+    BINDTAG = "TooltipBindtag"
+
+    _shared_tw = None
+    _shared_label = None
+    _bound = False
+    _texts = {}
+    _positions = {}
+
+    @classmethod
+    def register(cls, widget, text=""):
+        cls._texts[str(widget)] = text
+        widget.bindtags((*widget.bindtags(), cls.BINDTAG))
+        if not cls._bound:
+            widget.bind_class(cls.BINDTAG, "<Enter>", cls.show_tooltip)
+            widget.bind_class(cls.BINDTAG, "<Leave>", cls.hide_tooltip)
+            # screen positions only change when the window moves/resizes; the toplevel's
+            # tag also sees its children's <Configure>, so one binding covers both
+            widget.winfo_toplevel().bind("<Configure>", cls._invalidate_pos, add="+")
+            cls._bound = True
+
+    @classmethod
+    def _popup(cls, widget):
+        # one hidden Toplevel is reused for every hover instead of created/destroyed each time
+        if cls._shared_tw is None:
+            tw = tk.Toplevel(widget.winfo_toplevel())
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            cls._shared_label = tk.Label(
+                tw, justify="left",
+                background="#2d2d2d", foreground="#ffffff",
+                relief="solid", borderwidth=1, font=("Segoe UI", 9),
+                wraplength=200
+            )
+            cls._shared_label.pack(ipadx=5, ipady=3)
+            cls._shared_tw = tw
+        return cls._shared_tw
+
+    @classmethod
+    def show_tooltip(cls, event):
+        widget = event.widget
+        key = str(widget)
+        text = cls._texts.get(key)
+        if not text:
             return
-        x = self.widget.winfo_rootx() + 25
-        y = self.widget.winfo_rooty() + 25
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.geometry(f"+{x}+{y}")
-        label = tk.Label(
-            tw, text=self.text, justify="left",
-            background="#2d2d2d", foreground="#ffffff",
-            relief="solid", borderwidth=1, font=("Segoe UI", 9),
-            wraplength=200
-        )
-        label.pack(ipadx=5, ipady=3)
+        pos = cls._positions.get(key)
+        if pos is None:
+            pos = cls._positions[key] = (widget.winfo_rootx() + 25, widget.winfo_rooty() + 25)
+        tw = cls._popup(widget)
+        cls._shared_label.config(text=text)
+        tw.geometry(f"+{pos[0]}+{pos[1]}")
+        tw.deiconify()
+
+    @classmethod
+    def _invalidate_pos(cls, event=None):
+        cls._positions.clear()
 
-    def hide_tooltip(self, event=None):
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+    @classmethod
+    def hide_tooltip(cls, event=None):
+        if cls._shared_tw is not None:
+            cls._shared_tw.withdraw()
 
 
 # ---------------- PASSWORD STRENGTH BAR ----------------
 class PasswordStrengthIndicator:
     """Displays real-time strength updates for a password"""
 
+    _COLORS = ("#ff4444", "#ff8800", "#ffaa00", "#88cc00", "#44ff44")
+    _LABELS = ("Very Weak", "Weak", "Fair", "Good", "Strong")
+    _BAR_WIDTHS = tuple((s + 1) * 40 for s in range(5))
+
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
         self.frame.pack(fill="x", pady=(5, 0))
@@ -94,25 +204,30 @@ class PasswordStrengthIndicator:
         self.score_label = ttk.Label(self.frame, text="", font=("Segoe UI", 9, "bold"))
         self.score_label.pack(side="left", padx=(10, 0))
 
+        # items are created once and only reconfigured on updates
+        self._fill_id = self.strength_bar.create_rectangle(0, 0, 0, 20, fill=self._COLORS[0], outline="")
+        self._border_id = self.strength_bar.create_rectangle(0, 0, 200, 20, outline="#444444", width=1)
+        self._label_text = ""
+
     def update_strength(self, score):
-        colors = ["#ff4444", "#ff8800", "#ffaa00", "#88cc00", "#44ff44"]
-        labels = ["Very Weak", "Weak", "Fair", "Good", "Strong"]
         score = max(0, min(score, 4))
-        width = (score + 1) * 40
-        self.strength_bar.delete("all")
-        self.strength_bar.create_rectangle(0, 0, width, 20, fill=colors[score], outline="")
-        self.strength_bar.create_rectangle(0, 0, 200, 20, outline="#444444", width=1)
-        self.score_label.config(text=f"{labels[score]} ({score}/4)")
+        self.strength_bar.coords(self._fill_id, 0, 0, self._BAR_WIDTHS[score], 20)
+        self.strength_bar.itemconfig(self._fill_id, fill=self._COLORS[score])
+        self._set_label(f"{self._LABELS[score]} ({score}/4)")
+
+    def clear(self):
+        self.strength_bar.coords(self._fill_id, 0, 0, 0, 20)
+        self._set_label("")
+
+    def _set_label(self, text):
+        if text != self._label_text:
+            self._label_text = text
+            self.score_label.config(text=text)
 
 
 # ---------------- MODERN BUTTON ----------------
 class ModernButton(ttk.Button):
-    """Custom hover-style button"""
-
-    def __init__(self, parent, **kwargs):
-        super().__init__(parent, **kwargs)
-        self.bind("<Enter>", lambda e: self.configure(style="Hover.TButton"))
-        self.bind("<Leave>", lambda e: self.configure(style="TButton"))
+    """Custom hover-style button (hover colour comes from the TButton "active" style map)"""
 
 
 # ---------------- PROGRESS DIALOG ----------------
@@ -121,27 +236,35 @@ class ProgressDialog:
 
     def __init__(self, parent, title="Processing", message="Please wait..."):
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title(title)
         self.dialog.geometry("400x150")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        # no grab_set: the main window stays responsive; closing the dialog cancels
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         self.dialog.configure(bg="#1a1a1a")
 
         tk.Label(self.dialog, text=message, bg="#1a1a1a", fg="#ffffff", font=("Segoe UI", 10)).pack(pady=20)
-        self.progress = ttk.Progressbar(self.dialog, mode="indeterminate")
+        # determinate: advanced by the worker via set_progress, no idle animation loop
+        self.progress = ttk.Progressbar(self.dialog, mode="determinate", maximum=100)
         self.progress.pack(pady=10, padx=20, fill="x")
-        self.progress.start()
         ttk.Button(self.dialog, text="Cancel", command=self.cancel).pack(pady=10)
         self.cancelled = False
+        self.dialog.deiconify()
 
     def cancel(self):
         self.cancelled = True
         self.destroy()
 
+    def set_progress(self, frac):
+        # may arrive after Cancel already closed the dialog
+        if self.dialog.winfo_exists():
+            self.progress["value"] = min(frac, 1.0) * 100
+
     def destroy(self):
-        self.progress.stop()
-        self.dialog.destroy()
+        if self.dialog.winfo_exists():
+            self.dialog.destroy()
 
 
 # ---------------- MAIN GUI APP ----------------
@@ -150,15 +273,26 @@ class PasswordAnalyzerGUI:
 
     def __init__(self, root):
         self.root = root
+        # build everything while hidden so geometry is computed once, then show
+        self.root.withdraw()
+        # long-lived workers for analysis/generation instead of a thread per task
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pa")
+        # workers never call Tk (pool threads are joined at exit, and a Tk call from a
+        # thread after mainloop ends can block); they queue callbacks for the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
         self.setup_window()
         self.setup_styles()
         self.setup_vars()
         self.build_ui()
         self.load_settings()
+        self.root.update_idletasks()
+        self.root.deiconify()
+        # pay zxcvbn's dictionary load off the UI path, before the first keystroke
+        self._pool.submit(self._warmup_backend)
 
     def setup_window(self):
         self.root.title("Password Analyzer & Wordlist Generator")
-        self.root.geometry("1000x800")
         self.root.minsize(800, 700)
         self.root.configure(bg="#1a1a1a")
         x = (self.root.winfo_screenwidth() // 2) - 500
@@ -168,13 +302,10 @@ class PasswordAnalyzerGUI:
     def setup_styles(self):
         style = ttk.Style(self.root)
         style.theme_use("clam")
-        style.configure("TFrame", background="#1a1a1a")
-        style.configure("TLabel", background="#1a1a1a", foreground="#ffffff")
-        style.configure("TButton", background="#2d2d2d", foreground="#ffffff")
-        style.configure("Hover.TButton", background="#404040", foreground="#ffffff")
-        style.configure("TNotebook", background="#1a1a1a")
-        style.configure("TNotebook.Tab", background="#2d2d2d", foreground="#ffffff", padding=[20, 10])
-        style.map("TNotebook.Tab", background=[("selected", "#404040")])
+        for name, opts in _STYLE_SPEC:
+            style.configure(name, **opts)
+        for name, opts in _STYLE_MAPS:
+            style.map(name, **opts)
 
     def setup_vars(self):
         self.pwd_var = tk.StringVar()
@@ -188,6 +319,16 @@ class PasswordAnalyzerGUI:
         self.rev_var = tk.BooleanVar()
         self.repeat_var = tk.BooleanVar()
         self.show_pwd_var = tk.BooleanVar()
+        self._inputs = None  # parsed personal info tokens, None when a field changed
+        self._progress = None  # dialog of the running wordlist job, if any
+
+        # real-time strength: debounce keystrokes, analyze off the Tk thread; the personal
+        # info fields feed zxcvbn's user_inputs, so edits there re-score the password too
+        self._analyze_after_id = None
+        self._bulk_update = False
+        self.pwd_var.trace_add("write", self._on_password_changed)
+        for v in (self.name_var, self.pet_var, self.fav_var, self.dob_var):
+            v.trace_add("write", self._on_inputs_changed)
 
     def build_ui(self):
         main = ttk.Frame(self.root, padding="15")
@@ -254,7 +395,8 @@ class PasswordAnalyzerGUI:
         ttk.Label(maxf, text="Max words:").pack(side="left")
         ttk.Entry(maxf, textvariable=self.maxwords_var, width=10).pack(side="left", padx=(10, 0))
 
-        ModernButton(tab, text="Generate Wordlist", command=self.generate_wordlist).pack(pady=15)
+        self.generate_btn = ModernButton(tab, text="Generate Wordlist", command=self.generate_wordlist)
+        self.generate_btn.pack(pady=15)
 
     def build_output_section(self, parent):
         frame = ttk.LabelFrame(parent, text="Output", padding="10")
@@ -262,12 +404,14 @@ class PasswordAnalyzerGUI:
         text_frame = ttk.Frame(frame)
         text_frame.pack(fill="both", expand=True)
         self.output = tk.Text(text_frame, height=10, font=("Consolas", 9),
-                              bg="#0d1117", fg="#ffffff", insertbackground="#ffffff", wrap="word")
+                              bg="#0d1117", fg="#ffffff", insertbackground="#ffffff", wrap="word",
+                              state="disabled")
+        self._see_pending = False
         scroll = ttk.Scrollbar(text_frame, command=self.output.yview)
         self.output.configure(yscrollcommand=scroll.set)
         self.output.pack(side="left", fill="both", expand=True)
         scroll.pack(side="right", fill="y")
-        ModernButton(frame, text="Clear Output", command=lambda: self.output.delete(1.0, tk.END)).pack(anchor="e", pady=(10, 0))
+        ModernButton(frame, text="Clear Output", command=self.clear_output).pack(anchor="e", pady=(10, 0))
 
     # ---------------- Helpers ----------------
     def create_input(self, parent, label, var, tip):
@@ -276,49 +420,134 @@ class PasswordAnalyzerGUI:
         ttk.Label(frame, text=label).pack(anchor="w")
         entry = ttk.Entry(frame, textvariable=var)
         entry.pack(fill="x", pady=(2, 0))
-        ToolTip(entry, tip)
+        ToolTip.register(entry, tip)
         return entry
 
+    def _post(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from workers."""
+        self._ui_queue.put((fn, args))
+
+    def _drain_ui_queue(self):
+        # re-arm first so one failing callback doesn't stop the polling
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
+
+    def write_output(self, text, replace=False):
+        """Append (or replace with) text in the read-only output box in one mutation."""
+        self.output.configure(state="normal")
+        if replace and self.output.index("end-1c") != "1.0":
+            self.output.delete(1.0, tk.END)
+        self.output.insert(tk.END, text)
+        self.output.configure(state="disabled")
+        if not replace:
+            self._schedule_see_end()
+
+    def _schedule_see_end(self):
+        # scroll appended output into view at most once per 100 ms, however many writes land
+        if not self._see_pending:
+            self._see_pending = True
+            self.root.after(100, self._see_end)
+
+    def _see_end(self):
+        self._see_pending = False
+        if self.output.winfo_viewable():
+            self.output.see(tk.END)
+
+    def clear_output(self):
+        self.output.configure(state="normal")
+        self.output.delete(1.0, tk.END)
+        self.output.configure(state="disabled")
+
     def toggle_pwd(self):
         self.pwd_entry.configure(show="" if self.show_pwd_var.get() else "*")
 
     def collect_inputs(self):
-        vals = []
-        for v in [self.name_var, self.pet_var, self.fav_var, self.dob_var]:
-            vals.extend(x.strip() for x in v.get().replace(",", " ").split() if x.strip())
-        return vals
+        # read and split the fields only after one changed (the traces reset the cache),
+        # so repeated analyses don't re-fetch four Tcl variables each time
+        if self._inputs is None:
+            vals = []
+            for v in (self.name_var, self.pet_var, self.fav_var, self.dob_var):
+                s = v.get()
+                if s:
+                    vals.extend(_tokenize(s))
+            self._inputs = vals
+        return list(self._inputs)
 
     def analyze_password(self):
         pwd = self.pwd_var.get().strip()
         if not pwd:
             messagebox.showwarning("Missing Input", "Please enter a password.")
             return
+        # zxcvbn can take a while on long inputs; keep it off the Tk thread
+        self._pool.submit(self._analyze_worker, pwd, self.collect_inputs())
+
+    def _warmup_backend(self):
         try:
-            data = analyze_password(pwd, user_inputs=self.collect_inputs())
-            self.display_analysis(data, pwd)
+            analyze_password("warmup")
+            generate_from_parts(["x"], max_words=1)
+        except Exception:
+            pass
+
+    def _analyze_worker(self, pwd, user_inputs):
+        try:
+            data = analyze_password(pwd, user_inputs=user_inputs)
+            self._post(self.display_analysis, data, pwd)
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self._post(messagebox.showerror, "Error", str(e))
+
+    def _on_inputs_changed(self, *_):
+        self._inputs = None
+        self._schedule_analyze()
+
+    def _on_password_changed(self, *_):
+        # instant entropy estimate per keystroke; full zxcvbn only once typing settles
+        pwd = self.pwd_var.get().strip()
+        if pwd:
+            self.strength_indicator.update_strength(_quick_entropy_score(pwd))
+        self._schedule_analyze()
+
+    def _schedule_analyze(self):
+        if self._bulk_update:
+            return
+        if self._analyze_after_id is not None:
+            self.root.after_cancel(self._analyze_after_id)
+        self._analyze_after_id = self.root.after(ANALYZE_DEBOUNCE_MS, self._run_analyze_bg)
+
+    def _run_analyze_bg(self):
+        self._analyze_after_id = None
+        pwd = self.pwd_var.get().strip()
+        if not pwd:
+            self.strength_indicator.clear()
+            return
+        inputs = self.collect_inputs()
+
+        def task():
+            data = analyze_password(pwd, user_inputs=inputs)
+            self._post(self._apply_strength, pwd, data)
+
+        self._pool.submit(task)
+
+    def _apply_strength(self, pwd, data):
+        # drop results for a password the user has already changed
+        if pwd == self.pwd_var.get().strip():
+            self.strength_indicator.update_strength(data.get("score", 0))
 
     def display_analysis(self, data, pwd):
-        self.output.delete(1.0, tk.END)
-        out = [
-            "=" * 60,
-            "PASSWORD ANALYSIS RESULTS",
-            "=" * 60,
-            f"Password: {'*' * len(pwd)}",
-            f"Score: {data.get('score', 'N/A')}/4",
-            "",
-            "CRACK TIME ESTIMATES:"
-        ]
-        for k, v in data.get("crack_times_display", {}).items():
-            out.append(f"  {k}: {v}")
         fb = data.get("feedback", {})
-        if fb.get("warning"):
-            out.append(f"\nWARNING: {fb['warning']}")
-        if fb.get("suggestions"):
-            out.append("\nSUGGESTIONS:")
-            out.extend(f"  • {s}" for s in fb["suggestions"])
-        self.output.insert(tk.END, "\n".join(out) + "\n" + "=" * 60)
+        warning, suggestions = fb.get("warning"), fb.get("suggestions")
+        text = _ANALYSIS_TPL.format(
+            mask="*" * len(pwd),
+            score=data.get("score", "N/A"),
+            ct="".join(f"\n  {k}: {v}" for k, v in data.get("crack_times_display", {}).items()),
+            warn=f"\n\nWARNING: {warning}" if warning else "",
+            sugg="\n\nSUGGESTIONS:" + "".join(f"\n  • {s}" for s in suggestions) if suggestions else "",
+        )
+        self.write_output(text, replace=True)
 
     def generate_wordlist(self):
         inputs = self.collect_inputs()
@@ -329,46 +558,104 @@ class PasswordAnalyzerGUI:
             max_words = int(self.maxwords_var.get().strip() or 20000)
         except ValueError:
             max_words = 20000
-        progress = ProgressDialog(self.root, "Generating Wordlist", "Generating custom wordlist...")
+        years_text = self.years_var.get().strip()
+        years = expand_years(_tokenize(years_text)) if years_text else []
+        # Tk is not thread-safe: ask for the path and read options here, not in the worker
+        gzip_out = self.gzip_var.get()
+        add_reversed, add_repeats = self.rev_var.get(), self.repeat_var.get()
+        ext = ".gz" if gzip_out else ".txt"
+        path = filedialog.asksaveasfilename(defaultextension=ext, filetypes=[("Text", "*.txt"), ("Gzip", "*.gz")])
+        if not path:
+            return
+        # one job at a time: a second one would tie up the other worker the live analysis uses
+        self.generate_btn.configure(state="disabled")
+        progress = self._progress = ProgressDialog(self.root, "Generating Wordlist", "Generating custom wordlist...")
 
-        def task():
+        def task(path):
+            count, saved = 0, None
             try:
-                words = generate_from_parts(inputs, max_words=max_words,
-                                            add_reversed=self.rev_var.get(),
-                                            add_repeats=self.repeat_var.get())
+                step = max(1, max_words // 100)
+
+                def words():
+                    # generated words go straight to the file; only the count is kept
+                    nonlocal count
+                    for w in iter_wordlist(inputs, years=years, max_words=max_words,
+                                           add_reversed=add_reversed, add_repeats=add_repeats):
+                        if progress.cancelled:
+                            return
+                        count += 1
+                        if count % step == 0:
+                            self._post(progress.set_progress, count / max_words)
+                        yield w
+
+                path = save_wordlist(words(), path, gzip_out=gzip_out)
                 if progress.cancelled:
-                    return
-                ext = ".gz" if self.gzip_var.get() else ".txt"
-                path = filedialog.asksaveasfilename(defaultextension=ext, filetypes=[("Text", "*.txt"), ("Gzip", "*.gz")])
-                if path:
-                    save_wordlist(words, path, gzip_out=self.gzip_var.get())
-                    self.root.after(0, lambda: self.output.insert(tk.END, f"\n✓ Saved {len(words)} words to {path}\n"))
+                    os.remove(path)  # don't leave a truncated wordlist behind
+                else:
+                    saved = path
+            except Exception as e:
+                self._post(messagebox.showerror, "Error", str(e))
             finally:
-                self.root.after(0, progress.destroy)
+                # one cross-thread post closes the dialog and reports, in that order
+                self._post(self._finish_generation, progress, count, saved)
+
+        self._pool.submit(task, path)
 
-        threading.Thread(target=task, daemon=True).start()
+    def _finish_generation(self, progress, n, path):
+        self._progress = None
+        progress.destroy()
+        self.generate_btn.configure(state="normal")
+        if path is not None:
+            self.write_output(f"\n✓ Saved {n} words to {path}\n")
 
     def load_settings(self):
+        # setting several traced vars: run the trace callbacks once at the end, not per var
+        self._bulk_update = True
         try:
-            with open("gui_settings.json", "r") as f:
-                data = json.load(f)
+            with open(SETTINGS_FILE, "rb") as f:
+                data = json.loads(f.read())
             for k, v in data.items():
                 if hasattr(self, f"{k}_var"):
                     getattr(self, f"{k}_var").set(v)
         except Exception:
             pass
+        finally:
+            self._bulk_update = False
+        self._saved_settings = self._settings_snapshot()
+        self._on_inputs_changed()
 
-    def save_settings(self):
-        data = {k: getattr(self, f"{k}_var").get() for k in
+    def _settings_snapshot(self):
+        return {k: getattr(self, f"{k}_var").get() for k in
                 ["name", "pet", "fav", "dob", "years", "maxwords", "gzip", "rev", "repeat", "show_pwd"]}
-        with open("gui_settings.json", "w") as f:
-            json.dump(data, f, indent=2)
+
+    def save_settings(self):
+        data = self._settings_snapshot()
+        if data == self._saved_settings:
+            return  # nothing changed since load/last save
+        # write-then-rename so a crash mid-save never leaves a truncated settings file
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        tmp = SETTINGS_FILE + ".tmp"
+        with open(tmp, "wb", buffering=1 << 16) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, SETTINGS_FILE)
+        self._saved_settings = data
+
+    def on_closing(self):
+        if self._progress is not None:
+            # stop a running job so it deletes its partial file instead of finishing it
+            self._progress.cancelled = True
+        self.save_settings()
+        clear_cache()  # cached analyses hold the typed passwords
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
 
 
 def main():
     root = tk.Tk()
     app = PasswordAnalyzerGUI(root)
-    root.protocol("WM_DELETE_WINDOW", lambda: (app.save_settings(), root.destroy()))
+    root.protocol("WM_DELETE_WINDOW", app.on_closing)
     root.mainloop()
 
 